@@ -1,27 +1,48 @@
 """
-Helper functions to move the cursor around in standard out
+Helper functions to build the characters that move the cursor around in standard out. Each move is a single escape
+sequence no matter how far the cursor moves
 """
+import sys
 
 
 def cursor_up(n):
-    write_chars('\x1b[1A', n)
+    return f'\x1b[{n}A' if n > 0 else ''
 
 
 def cursor_down(n):
-    write_chars('\x1b[1B', n)
+    return f'\x1b[{n}B' if n > 0 else ''
 
 
 def cursor_left(n):
-    write_chars('\x1b[1D', n)
+    return f'\x1b[{n}D' if n > 0 else ''
 
 
 def cursor_right(n):
-    write_chars('\x1b[1C', n)
+    return f'\x1b[{n}C' if n > 0 else ''
+
+
+def cursor_save():
+    return '\x1b7'
+
+
+def cursor_restore():
+    return '\x1b8'
+
+
+def clear_line():
+    return '\x1b[2K'
 
 
 def clear_last_lines(n):
-    write_chars('\x1b[1A\x1b[2K', n)
+    # moves up to the first line to clear and clears everything from there to the end of the screen
+    return f'\x1b[{n}A\x1b[J' if n > 0 else ''
+
 
+def write(text):
+    """
+    Writes text to standard out with a single write and flush
 
-def write_chars(ch, n):
-    print(ch * n, end='', flush=True)
+    :param text: the text to write
+    """
+    sys.stdout.write(text)
+    sys.stdout.flush()
@@ -5,39 +5,155 @@ Logic/data structures for the minesweeper game
 """
 import numpy as np
 import time
+from functools import lru_cache
 
 # minesweeper game statuses
 LOST = 'lost'
 WON = 'won'
 IN_PROGRESS = 'in_progress'
 
+# visible states
+_MARK_HIDDEN = 0
+_MARK_VISIBLE = 1
+_MARK_FLAG = 2
+_MARK_QUESTION_MARK = 3
+
+# random number generator used to place the mines
+_RNG = np.random.default_rng()
+
+
+@lru_cache(maxsize=8)
+def _find_neighbors(width, height):
+    """
+    Finds the neighboring squares of every square on the board, where squares are referred to by their flattened index.
+    The tables are cached by board size and shared between games, so they are read only
+
+    :param width: the horizontal length of the board
+    :param height: the vertical length of the board
+    :return: a tuple of two arrays where the neighbors of square k are
+        neighbors[neighbor_start[k]:neighbor_start[k + 1]]
+    """
+    x, y = np.divmod(np.arange(width * height), height)
+
+    squares = []
+    neighbors = []
+    for i in range(-1, 2):
+        for j in range(-1, 2):
+            if i or j:
+                is_valid = (0 <= x + i) & (x + i < width) & (0 <= y + j) & (y + j < height)
+                squares.append(np.flatnonzero(is_valid))
+                neighbors.append(((x + i) * height + y + j)[is_valid])
+
+    # groups the neighbors by the square they belong to
+    squares = np.concatenate(squares)
+    neighbors = np.concatenate(neighbors)[np.argsort(squares, kind='stable')]
+
+    neighbor_start = np.zeros(width * height + 1, dtype=np.int32)
+    np.cumsum(np.bincount(squares, minlength=width * height), out=neighbor_start[1:])
+    neighbors = neighbors.astype(np.int32)
+
+    neighbor_start.flags.writeable = False
+    neighbors.flags.writeable = False
+    return neighbor_start, neighbors
+
+
+def _flood(board, visible, neighbor_start, neighbors, square, chord, uncovered):
+    """
+    Uncovers a square and iteratively uncovers the neighbors of every empty square uncovered along the way. Squares are
+    referred to by their flattened index and all the arrays are flattened
+
+    :param board: the board data
+    :param visible: the visible states of the board, updated in place
+    :param neighbor_start: the index in neighbors where each square's neighbors start
+    :param neighbors: the neighbors of every square
+    :param square: the square to uncover
+    :param chord: if True, uncovers the neighbors of the already visible square rather than the square itself
+    :param uncovered: an array with a spot for every square to store the squares uncovered in, in the order they were
+        uncovered
+    :return: a tuple of the number of squares uncovered and True if a mine was uncovered; otherwise, False
+    """
+    # queue of squares left to search. Squares are marked as searched when added, so each square is added at most once
+    # and the queue never holds more squares than the board has
+    queue = np.empty(board.size, dtype=np.int32)
+    searched = np.zeros(board.size, dtype=np.bool_)
+    head = 0
+    tail = 0
+    searched[square] = True
+    if chord:
+        for k in neighbors[neighbor_start[square]:neighbor_start[square + 1]]:
+            if not searched[k]:
+                searched[k] = True
+                queue[tail] = k
+                tail += 1
+    else:
+        queue[tail] = square
+        tail += 1
+
+    count = 0
+    uncovered_mine = False
+    while head < tail:
+        square = queue[head]
+        head += 1
+        if visible[square] != _MARK_HIDDEN and visible[square] != _MARK_QUESTION_MARK:
+            continue
+
+        visible[square] = _MARK_VISIBLE
+        uncovered[count] = square
+        count += 1
+        if board[square] == -1:
+            uncovered_mine = True
+        elif board[square] == 0:
+            for k in neighbors[neighbor_start[square]:neighbor_start[square + 1]]:
+                if not searched[k]:
+                    searched[k] = True
+                    queue[tail] = k
+                    tail += 1
+
+    return count, uncovered_mine
+
+
+def _count_neighboring_mines(is_mine):
+    """
+    Counts the number of neighboring mines of every square
+
+    :param is_mine: an array with 1 where there is a mine and 0 otherwise
+    :return: an array with the number of neighboring mines of every square
+    """
+    # sums the mask shifted by each neighbor offset
+    width, height = is_mine.shape
+    padded = np.pad(is_mine, 1)
+    counts = np.zeros_like(is_mine)
+    for i in range(-1, 2):
+        for j in range(-1, 2):
+            if i or j:
+                counts += padded[1 + i:1 + i + width, 1 + j:1 + j + height]
+    return counts
+
 
 class Minesweeper:
     # default board size and number of mines for minesweeper
     DEFAULT_SIZE = 10
     DEFAULT_MINES = 10
 
-    # coordinate offsets to represent the neighbors of a square where the upper left of the board is (0, 0)
-    _OFFSETS = [
-        (1, 1),     # SE
-        (1, 0),     # E
-        (1, -1),    # NE
-        (0, 1),     # S
-        (0, -1),    # N
-        (-1, 1),    # SW
-        (-1, 0),    # W
-        (-1, -1)    # NW
-    ]
-
     # unicode characters
     _SQUARE = u'\u25a0'
     _FLAG = u'\u2691'
 
-    # visible states
-    _MARK_HIDDEN = 0
-    _MARK_VISIBLE = 1
-    _MARK_FLAG = 2
-    _MARK_QUESTION_MARK = 3
+    # board rendering modes
+    _IN_PROGRESS_BOARD = 'in_progress'
+    _GAME_OVER_BOARD = 'game_over'
+    _SHOW_ALL_BOARD = 'show_all'
+
+    # characters for each board value from -1 to 8, indexed by the board value plus one
+    _BOARD_CHARS = np.array(['*', _SQUARE, '1', '2', '3', '4', '5', '6', '7', '8'])
+
+    # characters for the game in progress board indexed by the visible state * 16 + the board value + 1
+    _IN_PROGRESS_CHARS = np.concatenate([
+        np.full(16, '-'),                                       # hidden
+        _BOARD_CHARS, np.full(16 - _BOARD_CHARS.size, '-'),     # visible
+        np.full(16, _FLAG),                                     # flag
+        np.full(16, '?')                                        # question mark
+    ])
 
     def __init__(
         self,
@@ -80,12 +196,32 @@ class Minesweeper:
 
         # stores the game data
         # -1 for a mine; otherwise the numerical count of the number of neighboring mines
-        self._board = np.zeros(shape=(self.width, self.height))
+        self._board = np.zeros(shape=(self.width, self.height), dtype=np.int8)
         # 0 for hidden, 1 for visible, 2 for flag, 3 for question mark
-        self._visible = np.zeros(shape=(self.width, self.height))
+        self._visible = np.zeros(shape=(self.width, self.height), dtype=np.int8)
 
-        # stores which indices have already been searched when recursively finding squares to recover
-        self._already_searched = None
+        # the number of squares that are not mines and are not uncovered yet, which is set when the board is generated
+        self._safe_remaining = 0
+
+        # stores the neighboring squares of every square
+        self._neighbor_start, self._neighbors = _find_neighbors(self.width, self.height)
+
+        # stores the squares uncovered by the last move
+        self._uncovered = np.empty(self.width * self.height, dtype=np.int32)
+
+        # stores the flattened indices of the squares that changed since the last call to changed_squares
+        self._changed = []
+
+    @staticmethod
+    def seed(seed=None):
+        """
+        Seeds the random number generator used to place the mines so that the boards generated afterwards are
+        reproducible
+
+        :param seed: the seed for the random number generator. If None, a seed is pulled from the operating system
+        """
+        global _RNG
+        _RNG = np.random.default_rng(seed)
 
     @property
     def height(self):
@@ -146,48 +282,6 @@ class Minesweeper:
         else:
             return self._time_elapsed
 
-    def _is_valid_point(self, x, y):
-        """
-        Checks if a coordinate point is on the board
-
-        :param x: x coordinate point
-        :param y: y coordinate point
-        :return: True if the coordinate point are is valid; otherwise, False
-        """
-        return 0 <= x < self.width and 0 <= y < self.height
-
-    def _call_neighbors(self, fn, x, y, check_searched=False, *args, **kwargs):
-        """
-        Calls a function for all valid neighboring squares
-
-        :param fn: Function to call that accepts x and y arguments followed by any number of args and kwargs
-        :param x: x coordinate point
-        :param y: y coordinate point
-        :param check_searched: if True, will check if a square has already been called by the recursive search rather
-            than calling the function again
-        :param args: args
-        :param kwargs: kwargs
-        :return: the logical or of all the return values from the functions called
-        """
-        out = None
-        for i, j in self._OFFSETS:
-            if self._is_valid_point(x + i, y + j):
-                if not check_searched or (self._already_searched is not None and self._already_searched[x + i, y + j] == 0):
-                    v = fn(x + i, y + j, *args, **kwargs)
-                    out = out or v
-
-        return out
-
-    def _update_board(self, x, y):
-        """
-        Upon creation of the game board, updates the board with the mine count from the neighboring squares
-
-        :param x: x coordinate point
-        :param y: y coordinate point
-        """
-        if self._board[x, y] != -1:
-            self._board[x, y] += 1
-
     def _generate_board(self, x, y):
         """
         Generates the board data and ensures that the player will never lose on the first move
@@ -197,17 +291,21 @@ class Minesweeper:
         """
         value = (x * self.height) + y
 
-        while True:
-            # random values to set as the mines on the board
-            mines_nums = np.random.default_rng().choice(self.width * self.height, size=self._mine_count, replace=False)
-            if value not in mines_nums:
-                break
+        # random values to set as the mines on the board, sampled from every square except the one of the first move
+        mines_nums = _RNG.choice(self.width * self.height - 1, size=self._mine_count, replace=False)
+        mines_nums[mines_nums >= value] += 1
+
+        # marks where the mines are on the board
+        is_mine = np.zeros(shape=(self.width, self.height), dtype=np.int8)
+        is_mine.flat[mines_nums] = 1
 
         # builds the board
-        for num in mines_nums:
-            i, j = divmod(num, self.height)
-            self._board[i, j] = -1
-            self._call_neighbors(self._update_board, i, j)
+        board = _count_neighboring_mines(is_mine)
+        board[is_mine == 1] = -1
+        self._board = board
+
+        # none of the squares that are not mines are uncovered yet
+        self._safe_remaining = self.width * self.height - self._mine_count
 
     def _count_neighboring_flags(self, x, y):
         """
@@ -217,54 +315,31 @@ class Minesweeper:
         :param y: y coordinate point
         :return: the number of mines that the user has marked that are adjacent to the current square
         """
-        count = 0
-        for i, j in self._OFFSETS:
-            if self._is_valid_point(x + i, y + j) and self._visible[x + i, y + j] == self._MARK_FLAG:
-                count += 1
+        square = x * self.height + y
+        neighbors = self._neighbors[self._neighbor_start[square]:self._neighbor_start[square + 1]]
 
-        return count
+        return int((self._visible.reshape(-1)[neighbors] == _MARK_FLAG).sum())
 
-    def _make_visible(self, x, y, level=0):
+    def _make_visible(self, x, y):
         """
-        Recursively uncovers a square
+        Uncovers a square and iteratively uncovers its neighboring squares
 
         :param x: x coordinate point
         :param y: y coordinate point
-        :param level: 0 is default, -1 for recursively searching hidden or question mark status, 1 for recursively
-            searching neighbors if the current position is already visible
-        :return: True if at least one square was uncovered; otherwise, False
-        """
-        self._already_searched[x, y] = 1
-        if self._visible[x, y] in {self._MARK_HIDDEN, self._MARK_QUESTION_MARK}:
-            self._visible[x, y] = self._MARK_VISIBLE
-            if self._board[x, y] == 0:
-                self._call_neighbors(self._make_visible, x, y, check_searched=True, level=-1)
-            return True
-        elif level == 0 and self._visible[x, y] == self._MARK_VISIBLE and self._board[x, y] == self._count_neighboring_flags(x, y):
-            return self._call_neighbors(self._make_visible, x, y, check_searched=True, level=1) or False
-        elif level == 1 and self._visible[x, y] in {self._MARK_HIDDEN, self._MARK_QUESTION_MARK}:
-            self._visible[x, y] = self._MARK_VISIBLE
-            return True
-
-        return False
-
-    def _check_game_status(self):
-        """
-        Checks the status of the game
-
-        :return: a string representing if the game is 'in_progress', 'lost', or 'won' after this move
-        """
-        is_in_progress = False
-        for i, j in np.ndindex(*self._visible.shape):
-            if self._visible[i, j] == self._MARK_VISIBLE and self._board[i, j] == -1:
-                return LOST
-            elif self._visible[i, j] != self._MARK_VISIBLE and self._board[i, j] != -1:
-                is_in_progress = True
-
-        if is_in_progress:
-            return IN_PROGRESS
-
-        return WON
+        :return: a tuple of the number of squares uncovered and True if a mine was uncovered; otherwise, False
+        """
+        # if the square is already visible and its number matches the number of neighboring flags, uncover the
+        # neighboring squares instead
+        chord = self._visible[x, y] == _MARK_VISIBLE and self._board[x, y] == self._count_neighboring_flags(x, y)
+        return _flood(
+            self._board.reshape(-1),
+            self._visible.reshape(-1),
+            self._neighbor_start,
+            self._neighbors,
+            x * self.height + y,
+            chord,
+            self._uncovered
+        )
 
     def uncover_square(self, x, y):
         """
@@ -279,22 +354,30 @@ class Minesweeper:
             self._start_time = time.time()
             self._generate_board(x, y)
 
-        if self._visible[x, y] == self._MARK_FLAG:
+        if self._visible[x, y] == _MARK_FLAG:
             # if square is a flag, no game status or squares to update
             pass
         elif self._board[x, y] == -1:
             self._status = LOST
             self._moves += 1
         else:
-            self._already_searched = np.zeros(shape=(self.width, self.height))
-            uncovered_square = self._make_visible(x, y)
-            if uncovered_square:
+            uncovered_count, uncovered_mine = self._make_visible(x, y)
+            if uncovered_count:
                 self._moves += 1
-            self._status = self._check_game_status()
+                self._safe_remaining -= uncovered_count
+                self._changed.append(self._uncovered[:uncovered_count].copy())
+
+            if uncovered_mine:
+                self._status = LOST
+            elif self._safe_remaining == 0:
+                self._status = WON
 
         if not self:
             self._time_elapsed = time.time() - self._start_time
 
+            # the mines that are not flagged and the incorrect flags change on the game over board
+            self._changed.append(np.flatnonzero((self._board == -1) != (self._visible == _MARK_FLAG)))
+
         return self._status
 
     def mark_square(self, x, y):
@@ -305,51 +388,64 @@ class Minesweeper:
         :param x: x coordinate point
         :param y: y coordinate point
         """
-        if self._visible[x, y] == self._MARK_HIDDEN:
+        if self._visible[x, y] == _MARK_HIDDEN:
             # convert from hidden to flag
-            self._visible[x, y] = self._MARK_FLAG
+            self._visible[x, y] = _MARK_FLAG
             self._player_mine_count += 1
-        elif self._visible[x, y] == self._MARK_FLAG:
+        elif self._visible[x, y] == _MARK_FLAG:
             # convert from flag to question mark
-            self._visible[x, y] = self._MARK_QUESTION_MARK
+            self._visible[x, y] = _MARK_QUESTION_MARK
             self._player_mine_count -= 1
-        elif self._visible[x, y] == self._MARK_QUESTION_MARK:
+        elif self._visible[x, y] == _MARK_QUESTION_MARK:
             # convert from question mark to hidden
-            self._visible[x, y] = self._MARK_HIDDEN
-
-    def _convert_board_to_char(self, v):
-        if v == 0:
-            # square if hidden
-            return self._SQUARE
-        elif v == -1:
-            # asterisk if mine
-            return '*'
+            self._visible[x, y] = _MARK_HIDDEN
         else:
-            # number of neighboring mines otherwise
-            return str(int(v))
+            # visible squares can not be marked
+            return
 
-    def _board_iterator(self, fn):
+        self._changed.append([x * self.height + y])
+
+    def _join_chars(self, chars):
         """
-        Iterates over the board to create nicely formatted output string with spaces between each column and new lines
+        Joins an array of characters into a nicely formatted output string with spaces between each column and new lines
         after each row except for the last one.
 
-        :param fn: the function to call that returns a single character based off of the x and y coordinates of the
-            board
+        :param chars: an array of single character strings with the same shape as the board
         :return: A string representing the board
         """
-        str_to_write = ''
-        for j in range(self.height):
-            str_to_write += ' ' * self.indent
-            for i in range(self.width):
-                str_to_write += fn(i, j)
+        indent_str = ' ' * self.indent
+
+        return '\n'.join(indent_str + ' '.join(row) for row in chars.T.tolist())
+
+    def _render_chars(self, mode, squares=None):
+        """
+        Gets the characters to display for every square on the board or for only some of the squares
+
+        :param mode: 'in_progress' for the game in progress board, 'game_over' for the game over board, or 'show_all'
+            for the board with everything visible
+        :param squares: an array of the flattened indices of the squares to get the characters of. If None, gets the
+            characters of every square
+        :return: an array of single character strings with the same shape as the board, or as squares if provided
+        """
+        if squares is None:
+            board = self._board
+            visible = self._visible
+        else:
+            board = self._board.reshape(-1)[squares]
+            visible = self._visible.reshape(-1)[squares]
 
-                if i + 1 != self.width:
-                    str_to_write += ' '
+        if mode == self._SHOW_ALL_BOARD:
+            return self._BOARD_CHARS[board + 1]
 
-            if j + 1 != self.height:
-                str_to_write += '\n'
+        chars = self._IN_PROGRESS_CHARS[visible * 16 + board + 1]
+        if mode == self._GAME_OVER_BOARD:
+            is_mine = board == -1
+            is_flag = visible == _MARK_FLAG
+            chars[is_mine & ~is_flag] = '*'
+            # incorrect flags
+            chars[is_flag & ~is_mine] = 'X'
 
-        return str_to_write
+        return chars
 
     def create_board(self):
         """
@@ -358,17 +454,27 @@ class Minesweeper:
 
         :return: A string representing the board
         """
-        def in_progress(i, j):
-            if self._visible[i, j] == self._MARK_VISIBLE:
-                return self._convert_board_to_char(self._board[i, j])
-            elif self._visible[i, j] == self._MARK_FLAG:
-                return self._FLAG
-            elif self._visible[i, j] == self._MARK_QUESTION_MARK:
-                return '?'
-            else:
-                return '-'
+        return self._join_chars(self._render_chars(self._IN_PROGRESS_BOARD))
 
-        return self._board_iterator(in_progress)
+    def changed_squares(self):
+        """
+        Gets the squares on the board that changed since the last time this was called, so that only those squares need
+        to be redrawn. The changed squares are tracked as the moves are made. Like when converting the game to a string,
+        the characters are from the game in progress board while the game is in progress and the game over board
+        otherwise
+
+        :return: a list of tuples with the x coordinate point, y coordinate point, and character of each changed square
+        """
+        if not self._changed:
+            return []
+
+        squares = np.unique(np.concatenate(self._changed))
+        self._changed = []
+
+        chars = self._render_chars(self._IN_PROGRESS_BOARD if self else self._GAME_OVER_BOARD, squares)
+        x, y = np.divmod(squares, self.height)
+
+        return list(zip(x.tolist(), y.tolist(), chars.tolist()))
 
     def create_game_over_board(self):
         """
@@ -378,20 +484,7 @@ class Minesweeper:
 
         :return: A string representing the board
         """
-        def game_over(i, j):
-            if self._visible[i, j] == self._MARK_FLAG:
-                if self._board[i, j] == -1:
-                    return self._FLAG
-                else:
-                    return 'X'
-            elif self._visible[i, j] == self._MARK_VISIBLE or self._board[i, j] == -1:
-                return self._convert_board_to_char(self._board[i, j])
-            elif self._visible[i, j] == self._MARK_QUESTION_MARK:
-                return '?'
-            else:
-                return '-'
-
-        return self._board_iterator(game_over)
+        return self._join_chars(self._render_chars(self._GAME_OVER_BOARD))
 
     def create_show_all_board(self):
         """
@@ -399,10 +492,7 @@ class Minesweeper:
 
         :return: A string representing the board
         """
-        def show_all(i, j):
-            return self._convert_board_to_char(self._board[i, j])
-
-        return self._board_iterator(show_all)
+        return self._join_chars(self._render_chars(self._SHOW_ALL_BOARD))
 
     def __bool__(self):
         """
@@ -1,13 +1,102 @@
 """
 Runs interactive minesweeper game in standard out
 """
-import copy
 import os
+from functools import cached_property, partial
 
-from minesweeper.cursor import *
+from minesweeper.cursor import (
+    clear_last_lines, clear_line, cursor_down, cursor_left, cursor_restore, cursor_right, cursor_save, cursor_up, write
+)
 from minesweeper.game import Minesweeper, WON, LOST
 from minesweeper.read import controls, Keys
-from minesweeper._text import *
+from minesweeper._text import HEADER_TEXT, HELP_SCREEN
+
+# main menu options
+MENU = (
+    'Play',
+    'Options',
+    'Help',
+    'Exit'
+)
+
+# option menu options
+OPTIONS = (
+    'Easy',
+    'Medium',
+    'Hard',
+    'Custom',
+    'Normal',
+    'Double Wide',
+    'Triple Wide',
+    'Back'
+)
+
+# custom options
+CUSTOM_PARAMS = ('Mines', 'Height', 'Width', 'Back')
+
+# how many times wider the board is and how many times more mines it has for each mode
+_MODE_MULTIPLIERS = {
+    'Normal': 1,
+    'Double Wide': 2,
+    'Triple Wide': 3
+}
+
+
+def make_game_options(options, mode, center):
+    """
+    Builds the options to create a game with for a difficulty level and mode
+
+    :param options: the options of the difficulty level, with the number of mines and either the size or the height and
+        width of the board. Custom boards with a height and width are always created as is, no matter the mode
+    :param mode: 'Normal', 'Double Wide', or 'Triple Wide'
+    :param center: the column of the center of the terminal
+    :return: a new dict of the options to create the game with
+    """
+    if 'size' in options:
+        multiplier = _MODE_MULTIPLIERS[mode]
+        height = options['size']
+        width = height * multiplier
+        mines = options['mines'] * multiplier
+    else:
+        height = options['height']
+        width = options['width']
+        mines = options['mines']
+
+    return {'height': height, 'width': width, 'mines': mines, 'indent': center - width}
+
+
+def build_centered_help_text(indent_str, width):
+    """
+    Builds a centered the help text to be shown on the help screen
+
+    :param indent_str: the string to indent every line with
+    :param width: the maximum length of a line before it is split into multiple
+    :return: a tuple of the string to write and the number of vertical lines it takes up
+    """
+    str_to_write = ''
+    line_count = 0
+    for line in HELP_SCREEN:
+        str_to_write += indent_str
+        partial_line = line
+        # if the line is too long, split it into multiple
+        while len(partial_line) > width:
+            # makes sure the line is split on a word
+            index = 0
+            for word in partial_line.split(' '):
+                if index + len(word) >= width:
+                    break
+                else:
+                    index += len(word) + 1
+
+            str_to_write += partial_line[:index] + '\n' + indent_str
+            line_count += 1
+
+            partial_line = partial_line[index:]
+
+        str_to_write += partial_line + '\n'
+        line_count += 1
+
+    return str_to_write, line_count
 
 
 class PlayMinesweeper:
@@ -16,28 +105,17 @@ class PlayMinesweeper:
     _OPEN_CIRCLE = u'\u25ef'
     _SOLID_CIRCLE = u'\u25cf'
 
-    # main menu options
-    MENU = (
-        'Play',
-        'Options',
-        'Help',
-        'Exit'
-    )
-
-    # option menu options
-    OPTIONS = (
-        'Easy',
-        'Medium',
-        'Hard',
-        'Custom',
-        'Normal',
-        'Double Wide',
-        'Triple Wide',
-        'Back'
-    )
-
-    # custom options
-    CUSTOM_PARAMS = ('Mines', 'Height', 'Width', 'Back')
+    # selector strings to put in front of menu options
+    _ARROW_STR = _RIGHT_ARROW + ' '
+    _BLANK_STR = ' ' * 2
+
+    # padding after the move count in the game info header indexed by the number of spaces
+    _PADS = tuple(' ' * i for i in range(12))
+
+    # the menu options, kept on the class as well
+    MENU = MENU
+    OPTIONS = OPTIONS
+    CUSTOM_PARAMS = CUSTOM_PARAMS
 
     _DEFAULT_DIFFICULTY = 'Easy'
     _DEFAULT_MODE = 'Normal'
@@ -47,9 +125,9 @@ class PlayMinesweeper:
         term_size = os.get_terminal_size()
         self._center = term_size.columns // 2
 
-        header_lines = HEADER_TEXT.split('\n')
-        header_length = len(header_lines[0])
+        header_length = HEADER_TEXT.index('\n')
         header_indent = self._center - (header_length // 2)
+        header_indent_str = ' ' * header_indent
 
         def build_centered_header_text():
             """
@@ -57,61 +135,25 @@ class PlayMinesweeper:
 
             :return: a tuple of the string to write and the number of vertical lines it takes up
             """
-            # adds an extra new line to the start of the header text
-            str_to_write = '\n'
-            line_count = 1
-            for line in header_lines:
-                line_count += 1
-                str_to_write += ' ' * header_indent + line + '\n'
-
-            # adds an extra new line to the end of the header text
-            str_to_write += '\n'
-            line_count += 1
-
-            return str_to_write, line_count
-
-        def build_centered_help_text():
-            """
-            Builds a centered the help text to be shown on the help screen
-
-            :return: a tuple of the string to write and the number of vertical lines it takes up
-            """
-            str_to_write = ''
-            line_count = 0
-            for line in HELP_SCREEN:
-                str_to_write += ' ' * header_indent
-                partial_line = line
-                # if the line is too long, split it into multiple
-                while len(partial_line) > header_length:
-                    # makes sure the line is split on a word
-                    index = 0
-                    for word in partial_line.split(' '):
-                        if index + len(word) >= header_length:
-                            break
-                        else:
-                            index += len(word) + 1
-
-                    str_to_write += partial_line[:index] + '\n' + ' ' * header_indent
-                    line_count += 1
-
-                    partial_line = partial_line[index:]
-
-                str_to_write += partial_line + '\n'
-                line_count += 1
+            # indents every line of the header text and adds an extra new line to the start and end of it
+            str_to_write = '\n' + header_indent_str + HEADER_TEXT.replace('\n', '\n' + header_indent_str) + '\n\n'
+            line_count = HEADER_TEXT.count('\n') + 3
 
             return str_to_write, line_count
 
         # defines the constants for the height of the screen of the various pages
 
         # gets the length of the number of arguments on the selector pages
-        self._MENU_LENGTH = len(self.MENU)
-        self._OPTIONS_LENGTH = len(self.OPTIONS)
-        self._CUSTOM_PARAMS_LENGTH = len(self.CUSTOM_PARAMS)
+        self._MENU_LENGTH = len(MENU)
+        self._OPTIONS_LENGTH = len(OPTIONS)
+        self._CUSTOM_PARAMS_LENGTH = len(CUSTOM_PARAMS)
 
         # builds string constants
         self._CENTERED_HEADER_TXT, self._HEADER_HEIGHT = build_centered_header_text()
-        self._HELP_TXT, self._HELP_HEIGHT = build_centered_help_text()
-        self._HELP_HEIGHT += 1  # for additional empty line
+
+        # stores how to center the help text, which is built the first time the help screen is opened
+        self._help_indent_str = header_indent_str
+        self._help_width = header_length
 
         # sets height of screen with additional spaces taken into account
         self._MENU_HEIGHT = self._MENU_LENGTH + 1
@@ -121,12 +163,23 @@ class PlayMinesweeper:
         # the sum of the height of the header, default board size, menu height and an additional empty line
         self._HOMEPAGE_HEIGHT = self._HEADER_HEIGHT + Minesweeper.DEFAULT_SIZE + self._MENU_HEIGHT + 1
 
+        # strings to indent the menu options on the selector pages
+        self._menu_indent = ' ' * (self._center - 4)
+        self._options_indent = ' ' * (self._center - 6)
+
+        # caches the rendered menu and option screens since the terminal width does not change while running
+        self._menu_cache = {}
+        self._options_cache = {}
+
         # stores the height of the board on the game screen
         self._BOARD_HEIGHT = 0
 
         # stores the string to indent the header on the game screen
         self._game_header_indent = ''
 
+        # stores the text to write to standard out on the next flush
+        self._out = []
+
         # values to store position of cursor
         self._x = 0
         self._y = 0
@@ -147,21 +200,49 @@ class PlayMinesweeper:
         # sets board indent for example board
         self._game_options[self._difficulty]['indent'] = self._center - self._game_options[self._difficulty]['size']
 
+    @cached_property
+    def _help_text(self):
+        """
+        Builds the help text the first time it is used
+
+        :return: a tuple of the string to write and the number of vertical lines it takes up, including an additional
+            empty line
+        """
+        str_to_write, line_count = build_centered_help_text(self._help_indent_str, self._help_width)
+        return str_to_write, line_count + 1
+
     @staticmethod
     def _break():
         return True
 
-    @staticmethod
-    def _on_key_input(fn=None, interrupt_fn=None):
+    def _write(self, text):
         """
-        Function wrapper for keyboard input
+        Stages text to be written to standard out on the next flush
+
+        :param text: the text to write
+        """
+        self._out.append(text)
+
+    def _flush(self):
+        """
+        Writes all of the staged text to standard out at once
+        """
+        if self._out:
+            write(''.join(self._out))
+            self._out = []
+
+    def _on_key_input(self, fn=None, interrupt_fn=None):
+        """
+        Function wrapper for keyboard input. Everything staged to write is flushed before waiting on more key presses,
+        so that each screen update is a single write, and key presses that are read at once, like when holding a key
+        down, are all written together
 
         :param fn: Function to call on keyboard input. Must have one positional argument. If this function returns True,
             it will break the keyboard input loop and exit. If no provided, will return on any key press
         :param interrupt_fn: Function to call on keyboard interrupt (CTRL-C)
         """
         try:
-            for key in controls():
+            for key in controls(on_idle=self._flush):
                 if fn:
                     out = fn(key)
                     if out:
@@ -173,31 +254,30 @@ class PlayMinesweeper:
             if interrupt_fn:
                 interrupt_fn()
 
-    def _create_label(self, label, offset=6):
+        self._flush()
+
+    def _create_label(self, label):
         """
         Helper function to create a formatted string for a label text for option/menu screens with an additional
         newline afterwards
 
         :param label: the label name
-        :param offset: the number of characters to the left to offset from center
         :return: a formatted string
         """
-        return ' ' * (self._center - offset) + label + '\n\n'
+        return self._options_indent + label + '\n\n'
 
-    def _add_right_arrow(self, pos, length, index):
+    def _add_right_arrow(self, pos, index):
         """
-        Helper function to write the right arrow selector based off of the current position, number of options, and the
-        index.
+        Helper function to write the right arrow selector based off of the current position and the index.
 
         :param pos: current position of the selected menu option
-        :param length: the number of menu options
         :param index: the current index as you iterate over the menu options
         :return: a string with a right arrow and a space if the position matches the index; otherwise, two spaces
         """
-        if pos % length == index:
-            return self._RIGHT_ARROW + ' '
+        if pos == index:
+            return self._ARROW_STR
         else:
-            return ' ' * 2
+            return self._BLANK_STR
 
     def launch_game(self):
         """
@@ -205,63 +285,75 @@ class PlayMinesweeper:
         """
         START = 1  # print the whole screen
         BODY = 2   # prints the example board and menu options
-        MENU = 3   # just prints the menu options
+        MENU_ONLY = 3  # just prints the menu options
 
-        def refresh_screen(status=MENU):
-            str_to_write = ''
+        def refresh_screen(status=MENU_ONLY):
+            parts = []
 
             if status == START or status == BODY:
                 if status == START:
-                    str_to_write += self._CENTERED_HEADER_TXT
+                    parts.append(self._CENTERED_HEADER_TXT)
 
                 # example board for home screen
                 game_example = Minesweeper(**self._game_options[self._DEFAULT_DIFFICULTY])
                 game_example.uncover_square(0, 0)
 
-                str_to_write += str(game_example.create_show_all_board()) + '\n\n'
+                parts.append(game_example.create_show_all_board() + '\n\n')
+
+            # the menu options only depend on the selected position
+            menu_str = self._menu_cache.get(self._menu_pos)
+            if menu_str is None:
+                menu_parts = []
+                for i, v in enumerate(MENU):
+                    arrow = self._add_right_arrow(self._menu_pos, i)
+                    menu_parts.append(f'{self._menu_indent}{arrow}{v}\n')
+
+                menu_parts.append('\n')
+                menu_str = self._menu_cache[self._menu_pos] = ''.join(menu_parts)
 
-            for i, v in enumerate(self.MENU):
-                str_to_write += ' ' * (self._center - 4)
-                str_to_write += self._add_right_arrow(self._menu_pos, self._MENU_LENGTH, i)
-                str_to_write += v + '\n'
+            parts.append(menu_str)
+            self._write(''.join(parts))
 
-            print(str_to_write)
+        def move_selector(step):
+            self._menu_pos = (self._menu_pos + step) % self._MENU_LENGTH
+            self._write(clear_last_lines(self._MENU_HEIGHT))
+            refresh_screen()
+
+        def play():
+            self._write(clear_last_lines(self._HOMEPAGE_HEIGHT))
+            self.play_game()
+            self._write(clear_last_lines(self._BOARD_HEIGHT))
+            refresh_screen(status=START)
+
+        def options():
+            self._write(clear_last_lines(self._HOMEPAGE_HEIGHT - self._HEADER_HEIGHT))
+            self.open_options_screen()
+            self._write(clear_last_lines(self._OPTIONS_HEIGHT))
+            refresh_screen(status=BODY)
+
+        def help_screen():
+            self._write(clear_last_lines(self._HOMEPAGE_HEIGHT))
+            self.open_help_screen()
+            self._write(clear_last_lines(self._help_text[1]))
+            refresh_screen(status=START)
+
+        # functions to call when each of the menu options is selected: Play, Options, Help, and Exit
+        menu_handlers = (play, options, help_screen, self._break)
+
+        def select():
+            return menu_handlers[self._menu_pos]()
+
+        key_handlers = {
+            Keys.W: partial(move_selector, -1),
+            Keys.S: partial(move_selector, 1),
+            Keys.ENTER: select,
+            Keys.BACKSPACE: self._break  # Exit
+        }
 
         def control_map(key):
-            self._menu_pos %= self._MENU_LENGTH
-            if key == Keys.W:
-                self._menu_pos -= 1
-                clear_last_lines(self._MENU_HEIGHT)
-                refresh_screen()
-            elif key == Keys.S:
-                self._menu_pos += 1
-                clear_last_lines(self._MENU_HEIGHT)
-                refresh_screen()
-            elif key == Keys.ENTER:
-                if self._menu_pos == 0:
-                    # Play
-                    clear_last_lines(self._HOMEPAGE_HEIGHT)
-                    self.play_game()
-                    clear_last_lines(self._BOARD_HEIGHT)
-                    refresh_screen(status=START)
-                elif self._menu_pos == 1:
-                    # Options
-                    clear_last_lines(self._HOMEPAGE_HEIGHT - self._HEADER_HEIGHT)
-                    self.open_options_screen()
-                    clear_last_lines(self._OPTIONS_HEIGHT)
-                    refresh_screen(status=BODY)
-                elif self._menu_pos == 2:
-                    # Help
-                    clear_last_lines(self._HOMEPAGE_HEIGHT)
-                    self.open_help_screen()
-                    clear_last_lines(self._HELP_HEIGHT)
-                    refresh_screen(status=START)
-                else:
-                    # Exit
-                    return self._break()
-            elif key == Keys.BACKSPACE:
-                # Exit
-                return self._break()
+            handler = key_handlers.get(key)
+            if handler:
+                return handler()
 
         # prints initial screen
         refresh_screen(status=START)
@@ -280,7 +372,7 @@ class PlayMinesweeper:
 
         def get_attr_and_count():
             # gets the custom param attribute name and associated count
-            attr = self.CUSTOM_PARAMS[self._custom_pos].lower()
+            attr = CUSTOM_PARAMS[self._custom_pos].lower()
             count = get_count(attr)
             return attr, count
 
@@ -289,31 +381,24 @@ class PlayMinesweeper:
             self._game_options['Custom'][attr] = count
 
         def refresh_screen(initial_header=False):
-            str_to_write = ''
+            parts = []
             if initial_header:
-                str_to_write = self._create_label('Custom:')
-            for i, v in enumerate(self.CUSTOM_PARAMS):
-                if i == self._CUSTOM_PARAMS_LENGTH - 1:
-                    str_to_write += '\n'
-
-                str_to_write += ' ' * (self._center - 6)
-                str_to_write += self._add_right_arrow(self._custom_pos, self._CUSTOM_PARAMS_LENGTH, i)
-
-                str_to_write += v
-
+                parts.append(self._create_label('Custom:'))
+            for i, v in enumerate(CUSTOM_PARAMS):
+                arrow = self._add_right_arrow(self._custom_pos, i)
                 if i != self._CUSTOM_PARAMS_LENGTH - 1:
-                    str_to_write += ': {}'.format(get_count(v.lower()))
-
-                str_to_write += '\n'
+                    parts.append(f'{self._options_indent}{arrow}{v}: {get_count(v.lower())}\n')
+                else:
+                    parts.append(f'\n{self._options_indent}{arrow}{v}\n')
 
-            print(str_to_write)
+            parts.append('\n')
+            self._write(''.join(parts))
 
         def control_map(key):
-            self._custom_pos %= self._CUSTOM_PARAMS_LENGTH
             if key == Keys.W:
-                self._custom_pos -= 1
+                self._custom_pos = (self._custom_pos - 1) % self._CUSTOM_PARAMS_LENGTH
             elif key == Keys.S:
-                self._custom_pos += 1
+                self._custom_pos = (self._custom_pos + 1) % self._CUSTOM_PARAMS_LENGTH
             elif key == Keys.ENTER:
                 if self._custom_pos == 3:
                     # enforces limits to not break the program
@@ -354,7 +439,7 @@ class PlayMinesweeper:
                 return self._break()
 
             # no need to clear the initial label
-            clear_last_lines(self._CUSTOM_PARAMS_HEIGHT - 2)
+            self._write(clear_last_lines(self._CUSTOM_PARAMS_HEIGHT - 2))
             refresh_screen()
 
         # prints initial screen
@@ -368,67 +453,81 @@ class PlayMinesweeper:
         Opens and runs the option screen
         """
         # resets option position to difficulty index
-        self._options_pos = self.OPTIONS.index(self._difficulty)
+        self._options_pos = OPTIONS.index(self._difficulty)
 
         def refresh_screen(initial_header=False):
-            str_to_write = ''
+            cache_key = (initial_header, self._options_pos, self._difficulty, self._mode)
+            str_to_write = self._options_cache.get(cache_key)
+            if str_to_write is not None:
+                self._write(str_to_write)
+                return
+
+            parts = []
             if initial_header:
-                str_to_write = self._create_label('Difficulty:')
-            for i, v in enumerate(self.OPTIONS):
+                parts.append(self._create_label('Difficulty:'))
+            for i, v in enumerate(OPTIONS):
                 if v == self._DEFAULT_MODE:
-                    str_to_write += '\n' + self._create_label('Modes:')
+                    parts.append('\n' + self._create_label('Modes:'))
                 elif i == self._OPTIONS_LENGTH - 1:
-                    str_to_write += '\n'
-
-                str_to_write += ' ' * (self._center - 6)
-                str_to_write += self._add_right_arrow(self._options_pos, self._OPTIONS_LENGTH, i)
+                    parts.append('\n')
 
                 if i != self._OPTIONS_LENGTH - 1:
-                    if v == self._difficulty or v == self._mode:
-                        str_to_write += self._SOLID_CIRCLE + ' '
-                    else:
-                        str_to_write += self._OPEN_CIRCLE + ' '
+                    circle = self._SOLID_CIRCLE if v == self._difficulty or v == self._mode else self._OPEN_CIRCLE
+                    radio = circle + ' '
                 else:
-                    str_to_write += ' ' * 2
+                    radio = self._BLANK_STR
 
-                str_to_write += v + '\n'
+                arrow = self._add_right_arrow(self._options_pos, i)
+                parts.append(f'{self._options_indent}{arrow}{radio}{v}\n')
 
-            print(str_to_write)
+            parts.append('\n')
+            str_to_write = self._options_cache[cache_key] = ''.join(parts)
+            self._write(str_to_write)
 
-        def control_map(key):
-            self._options_pos %= self._OPTIONS_LENGTH
-            if key == Keys.W:
-                self._options_pos -= 1
-            elif key == Keys.S:
-                self._options_pos += 1
-            elif key == Keys.ENTER:
-                if self.OPTIONS[self._options_pos] in {self._difficulty, self._mode}.difference({'Custom'}):
-                    # no need to refresh the screen if nothing changed
+        def redraw():
+            # no need to clear the initial label
+            self._write(clear_last_lines(self._OPTIONS_HEIGHT - 2))
+            refresh_screen()
+
+        def move_selector(step):
+            self._options_pos = (self._options_pos + step) % self._OPTIONS_LENGTH
+            redraw()
+
+        def select():
+            if OPTIONS[self._options_pos] in {self._difficulty, self._mode}.difference({'Custom'}):
+                # no need to refresh the screen if nothing changed
+                return
+            elif 0 <= self._options_pos <= 3:
+                # Easy, Medium, Hard, and Custom
+                self._difficulty = OPTIONS[self._options_pos]
+
+                if self._options_pos == 3:
+                    # call custom screen
+                    self._write(clear_last_lines(self._OPTIONS_HEIGHT))
+                    self.open_custom_options_screen()
+                    self._write(clear_last_lines(self._CUSTOM_PARAMS_HEIGHT))
+                    refresh_screen(initial_header=True)
                     return
-                elif 0 <= self._options_pos <= 3:
-                    # Easy, Medium, Hard, and Custom
-                    self._difficulty = self.OPTIONS[self._options_pos]
-
-                    if self._options_pos == 3:
-                        # call custom screen
-                        clear_last_lines(self._OPTIONS_HEIGHT)
-                        self.open_custom_options_screen()
-                        clear_last_lines(self._CUSTOM_PARAMS_HEIGHT)
-                        refresh_screen(initial_header=True)
-                        return
-                elif 4 <= self._options_pos <= 6:
-                    # Normal, Double Wide, Triple Wide
-                    self._mode = self.OPTIONS[self._options_pos]
-                else:
-                    # Exit
-                    return self._break()
-            elif key == Keys.BACKSPACE:
+            elif 4 <= self._options_pos <= 6:
+                # Normal, Double Wide, Triple Wide
+                self._mode = OPTIONS[self._options_pos]
+            else:
                 # Exit
                 return self._break()
 
-            # no need to clear the initial label
-            clear_last_lines(self._OPTIONS_HEIGHT - 2)
-            refresh_screen()
+            redraw()
+
+        key_handlers = {
+            Keys.W: partial(move_selector, -1),
+            Keys.S: partial(move_selector, 1),
+            Keys.ENTER: select,
+            Keys.BACKSPACE: self._break  # Exit
+        }
+
+        def control_map(key):
+            handler = key_handlers.get(key)
+            if handler:
+                return handler()
 
         # prints initial screen
         refresh_screen(initial_header=True)
@@ -440,30 +539,27 @@ class PlayMinesweeper:
         """
         Opens help screen
         """
-        print(self._HELP_TXT)
+        self._write(self._help_text[0] + '\n')
         self._on_key_input()
 
     def play_game(self):
         # sets game options based off of difficulty level and mode selected
-        opts = self._game_options[self._difficulty]
-        if self._mode != self._DEFAULT_MODE and self._difficulty != 'Custom':
-            opts = copy.copy(opts)
-            h = opts.pop('size')
-            opts['height'] = h
-            if self._mode == 'Double Wide':
-                opts['width'] = 2 * h
-                opts['mines'] *= 2
-            else:
-                opts['width'] = 3 * h
-                opts['mines'] *= 3
-
-        opts['indent'] = self._center - (opts.get('width') or opts.get('size'))
+        opts = make_game_options(self._game_options[self._difficulty], self._mode, self._center)
 
         # creates an instance of the game
         game = Minesweeper(**opts)
+        # the board dimensions do not change while playing
+        height, width, indent = game.height, game.width, game.indent
         # calculates the number of new lines that need to be prepended to properly center the board
-        num_prepend_lines = max(self._DEFAULT_HEIGHT // 2 - game.height // 2, 6)
-        self._BOARD_HEIGHT = num_prepend_lines + game.height + 2
+        num_prepend_lines = max(self._DEFAULT_HEIGHT // 2 - height // 2, 6)
+        self._BOARD_HEIGHT = num_prepend_lines + height + 2
+        # the empty lines between the header and the board
+        prepend_lines_str = '\n' * (num_prepend_lines - 3)
+        # the lines of the game screen around the board relative to the top row of the board
+        header_row = 1 - num_prepend_lines
+        msg_row = 3 - num_prepend_lines
+        time_row = 4 - num_prepend_lines
+        footer_row = height + 1
 
         # keeps track of the coordinate points of the cursor on the board
         self._x = 0
@@ -477,21 +573,28 @@ class PlayMinesweeper:
             :param j: offset in the y direction
             :return: True if the offset is a valid cursor move; otherwise, False
             """
-            return 0 <= self._x + i < game.width and 0 <= self._y + j < game.height
+            return 0 <= self._x + i < width and 0 <= self._y + j < height
 
         def cursor_bottom_left():
             """
-            Moves cursor to bottom left of the board
+            Builds the characters to move the cursor to the bottom left of the board
+
+            :return: a string of the escape sequences to write
             """
-            cursor_down(game.height - self._y + 2)
-            cursor_left(game.indent + (self._x * 2))
+            return cursor_down(height - self._y + 2) + cursor_left(indent + (self._x * 2))
 
         def cursor_reset_original():
             """
-            Moves cursor its original location after refreshing the board or the top left of the board on start
+            Builds the characters to move the cursor to its original location after refreshing the board or the top left
+            of the board on start
+
+            :return: a string of the escape sequences to write
             """
-            cursor_right(game.indent + (self._x * 2))
-            cursor_up(game.height - self._y + 2)
+            return cursor_right(indent + (self._x * 2)) + cursor_up(height - self._y + 2)
+
+        # caches the game info header by the number of moves and marked mines
+        header_cache = {}
+        total_mines = opts['mines']
 
         def format_header():
             """
@@ -499,88 +602,140 @@ class PlayMinesweeper:
 
             :return: a formatted string with the game info
             """
-            moves_str = str(game.moves)
-            moves_ch_len = len(moves_str)
-            header_str = 'Moves: {}'.format(game.moves) + ' ' * (11 - moves_ch_len) + \
-                         'Mines: {}/{}'.format(game.mines, opts['mines'])
-            if not self._game_header_indent:
-                self._game_header_indent = ' ' * (self._center - len(header_str) // 2)
-            return self._game_header_indent + header_str
-
-        def build_game_screen(msg=None):
+            moves, mines = key = (game.moves, game.mines)
+            header_str = header_cache.get(key)
+            if header_str is None:
+                moves_str = str(moves)
+                pad = self._PADS[11 - len(moves_str)]
+                header_str = f'{self._game_header_indent}Moves: {moves_str}{pad}Mines: {mines}/{total_mines}'
+                header_cache[key] = header_str
+            return header_str
+
+        # centers the header off of the first game's starting header
+        if not self._game_header_indent:
+            self._game_header_indent = ' ' * (self._center - len(format_header()) // 2)
+            # drops the header that was cached before there was an indent
+            header_cache.clear()
+
+        def build_game_screen():
             """
-            Builds the text to write for the game screen. Includes header/footer text as well as text for the game board
+            Builds the text to write for the game screen. Includes header text as well as text for the game board
 
-            :param msg: Message to add to the header (should be used for displaying game over information)
             :return: a formatted string to write
             """
-            str_to_write = '\n' + format_header() + '\n\n'
-            remainder_lines = num_prepend_lines - 3
-            if msg:
-                str_to_write += self._game_header_indent + msg + '\n' + \
-                                self._game_header_indent + 'Time elapsed: {:.2f} seconds'.format(game.time)
-                remainder_lines -= 1
+            return ''.join(('\n', format_header(), '\n\n', prepend_lines_str, str(game), '\n\n'))
 
-            str_to_write += '\n' * remainder_lines + str(game) + '\n\n'
+        def move_cursor(i, j):
+            """
+            Builds the characters to move the cursor relative to its current location
+
+            :param i: number of characters to move in the x direction
+            :param j: number of lines to move in the y direction
+            :return: a string of the escape sequences to write
+            """
+            if i > 0:
+                str_to_write = cursor_right(i)
+            else:
+                str_to_write = cursor_left(-i)
 
-            if msg:
-                str_to_write += self._game_header_indent + 'Press any key to exit.'
+            if j > 0:
+                str_to_write += cursor_down(j)
+            else:
+                str_to_write += cursor_up(-j)
 
             return str_to_write
 
-        def refresh_board(**kwargs):
+        def rewrite_line(j, text):
+            """
+            Builds the characters to replace a line of the game screen in place and move the cursor back
+
+            :param j: the line to replace relative to the top row of the board
+            :param text: the new text of the line
+            :return: a string to write
+            """
+            return cursor_save() + move_cursor(-(indent + self._x * 2), j - self._y) + clear_line() + text + \
+                cursor_restore()
+
+        def redraw_squares(parts):
+            """
+            Adds the characters to redraw only the squares that changed since the last refresh and writes everything
+
+            :param parts: a list of the strings to write before the squares
+            """
+            for i, j, ch in game.changed_squares():
+                parts += [cursor_save(), move_cursor((i - self._x) * 2, j - self._y), ch, cursor_restore()]
+
+            self._write(''.join(parts))
+
+        def refresh_board():
+            """
+            Redraws the game info header and only the squares that changed since the last refresh, so that it looks like
+            the board was updated in place without reprinting it
+            """
+            redraw_squares([rewrite_line(header_row, format_header())])
+
+        def refresh_game_over_board(msg):
             """
-            Reprints the board in the same location in standard out so that it looks like the board was updated in place
+            Redraws the game info header with the game over information and the squares that changed on the game over
+            board
+
+            :param msg: Message to add to the header
             """
-            cursor_bottom_left()
-            clear_last_lines(self._BOARD_HEIGHT)
-            print(build_game_screen(**kwargs))
-            cursor_reset_original()
+            redraw_squares([
+                rewrite_line(header_row, format_header()),
+                rewrite_line(msg_row, self._game_header_indent + msg),
+                rewrite_line(time_row, self._game_header_indent + 'Time elapsed: {:.2f} seconds'.format(game.time)),
+                rewrite_line(footer_row, self._game_header_indent + 'Press any key to exit.')
+            ])
+
+        def move(i, j, text):
+            # moves the cursor by the offset if it stays on the board
+            if is_valid_cursor(i, j):
+                self._write(text)
+                self._x += i
+                self._y += j
+
+        def uncover():
+            result = game.uncover_square(self._x, self._y)
+            if result == LOST:
+                refresh_game_over_board('You lost! Game over :(')
+            elif result == WON:
+                refresh_game_over_board('Congratulations, you won! :)')
+            else:
+                refresh_board()
+
+        def mark():
+            game.mark_square(self._x, self._y)
+            refresh_board()
+
+        def exit_game():
+            self._write(cursor_bottom_left())
+            return self._break()
+
+        key_handlers = {
+            Keys.W: partial(move, 0, -1, cursor_up(1)),
+            Keys.A: partial(move, -1, 0, cursor_left(2)),
+            Keys.S: partial(move, 0, 1, cursor_down(1)),
+            Keys.D: partial(move, 1, 0, cursor_right(2)),
+            Keys.ENTER: uncover,
+            Keys.SPACE: mark,
+            Keys.BACKSPACE: exit_game
+        }
 
         def control_map(key):
             if not game:
                 # if the game is over, wait on any key press to exit
-                cursor_bottom_left()
-                return self._break()
-            elif key == Keys.W:
-                if is_valid_cursor(j=-1):
-                    cursor_up(1)
-                    self._y -= 1
-            elif key == Keys.A:
-                if is_valid_cursor(i=-1):
-                    cursor_left(2)
-                    self._x -= 1
-            elif key == Keys.S:
-                if is_valid_cursor(j=1):
-                    cursor_down(1)
-                    self._y += 1
-            elif key == Keys.D:
-                if is_valid_cursor(i=1):
-                    cursor_right(2)
-                    self._x += 1
-            elif key == Keys.ENTER:
-                result = game.uncover_square(self._x, self._y)
-                msg = ''
-                if result == LOST:
-                    msg = 'You lost! Game over :('
-                elif result == WON:
-                    msg = 'Congratulations, you won! :)'
-                refresh_board(msg=msg)
-            elif key == Keys.SPACE:
-                game.mark_square(self._x, self._y)
-                refresh_board()
-            elif key == Keys.BACKSPACE:
-                cursor_bottom_left()
-                return self._break()
+                return exit_game()
 
-        def on_interrupt():
-            cursor_bottom_left()
+            handler = key_handlers.get(key)
+            if handler:
+                return handler()
 
-        # print initial board
-        print(build_game_screen())
+        def on_interrupt():
+            self._write(cursor_bottom_left())
 
-        # moves cursor to top left of board
-        cursor_reset_original()
+        # print initial board and moves cursor to top left of board
+        self._write(build_game_screen() + '\n' + cursor_reset_original())
 
         # listen on keyboard input
         self._on_key_input(control_map, on_interrupt)
@@ -1,3 +1,6 @@
+import codecs
+import collections
+import os
 import sys
 import termios
 import tty
@@ -25,6 +28,25 @@ class Keys:
     DELETE = 'delete'
 
 
+# maps the character integer values and sequences to the game controls
+CHAR_KEYS = {
+    10: Keys.ENTER,
+    32: Keys.SPACE,
+    127: Keys.BACKSPACE
+}
+SEQUENCE_KEYS = {
+    tuple(UP): Keys.W,
+    tuple(DOWN): Keys.S,
+    tuple(LEFT): Keys.A,
+    tuple(RIGHT): Keys.D,
+    tuple(DELETE_SEQ): Keys.DELETE
+}
+
+# characters read from standard in that are not handled yet. This is shared so that if a screen stops reading the
+# controls, the characters already read are handled next in order
+_pending_chars = collections.deque()
+
+
 def get_char():
     """
     Reads a single character from standard in. CTRL-C raises a KeyboardInterrupt exception
@@ -41,6 +63,24 @@ def get_char():
     return ch
 
 
+def get_chars(fd, decoder):
+    """
+    Reads all of the characters that are already available from standard in at once, waiting on at least one. Standard
+    in should already be in cbreak mode. CTRL-C raises a KeyboardInterrupt exception
+
+    :param fd: the file descriptor of standard in
+    :param decoder: an incremental decoder to decode the bytes read with, so characters split between reads are kept
+    :return: a string of the characters read from standard in or an empty string at the end of the input
+    """
+    while True:
+        data = os.read(fd, 1024)
+        if not data:
+            return ''
+        chars = decoder.decode(data)
+        if chars:
+            return chars
+
+
 class Input:
     def __init__(self):
         # stores the input word
@@ -85,29 +125,40 @@ class Input:
         return self._word
 
 
-def controls():
+def controls(on_idle=None):
+    """
+    Reads the game controls from standard in. Standard in is kept in cbreak mode until the generator is closed, and all
+    of the characters that are available are read at once, like the rest of an arrow key sequence or repeated key
+    presses from holding a key down
+
+    :param on_idle: Function to call after all of the available characters are handled, right before waiting on more
+    :return: a generator of the game controls and printable characters pressed
+    """
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    decoder = codecs.getincrementaldecoder(sys.stdin.encoding or 'utf-8')(errors='replace')
     ascii_arr = []
-    while True:
-        ch = get_char()
-        i = ord(ch)
-        ascii_arr.append(i)
-        ascii_arr = ascii_arr[-4:]
-        if i == 10:
-            yield Keys.ENTER
-        elif i == 32:
-            yield Keys.SPACE
-        elif i == 127:
-            yield Keys.BACKSPACE
-        elif ascii_arr[-3:] == UP:
-            yield Keys.W
-        elif ascii_arr[-3:] == DOWN:
-            yield Keys.S
-        elif ascii_arr[-3:] == LEFT:
-            yield Keys.A
-        elif ascii_arr[-3:] == RIGHT:
-            yield Keys.D
-        elif ascii_arr == DELETE_SEQ:
-            yield Keys.DELETE
-        elif 33 <= i <= 126:
-            # printable characters
-            yield ch
+    try:
+        tty.setcbreak(fd)
+        while True:
+            if not _pending_chars:
+                if on_idle:
+                    on_idle()
+
+                chars = get_chars(fd, decoder)
+                if not chars:
+                    return
+                _pending_chars.extend(chars)
+
+            ch = _pending_chars.popleft()
+            i = ord(ch)
+            ascii_arr.append(i)
+            ascii_arr = ascii_arr[-4:]
+            key = CHAR_KEYS.get(i) or SEQUENCE_KEYS.get(tuple(ascii_arr[-3:])) or SEQUENCE_KEYS.get(tuple(ascii_arr))
+            if key:
+                yield key
+            elif 33 <= i <= 126:
+                # printable characters
+                yield ch
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)